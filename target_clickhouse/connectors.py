@@ -1,20 +1,112 @@
 from __future__ import annotations
 
-import typing
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable
 
+import requests
+import simplejson as json
 import sqlalchemy.types
 from clickhouse_sqlalchemy import (
     Table,
 )
+from clickhouse_sqlalchemy.exceptions import DatabaseException
+from requests.adapters import HTTPAdapter
 from singer_sdk import typing as th
 from singer_sdk.connectors import SQLConnector
-from sqlalchemy import Column, MetaData, create_engine
+from sqlalchemy import Column, MetaData, create_engine, func
+from sqlalchemy.engine import make_url
+from sqlalchemy.schema import CreateColumn, CreateTable
 
 from target_clickhouse.engine_class import create_engine_wrapper, SupportedEngines
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine
+    from sqlalchemy.sql import ColumnElement
+
+# Clickhouse error code for TABLE_ALREADY_EXISTS. The trailing period keeps it
+# from matching codes 570-579.
+_TABLE_ALREADY_EXISTS = "Code: 57."
+
+_ADD_COLUMN_DDL = "ALTER TABLE %(table_name)s ADD COLUMN %(create_column_clause)s"
+_ADD_COLUMN_ON_CLUSTER_DDL = (
+    "ALTER TABLE %(table_name)s ON CLUSTER %(cluster_name)s "
+    "ADD COLUMN %(create_column_clause)s"
+)
+_ALTER_COLUMN_DDL = (
+    "ALTER TABLE %(table_name)s MODIFY COLUMN %(column_name)s %(column_type)s"
+)
+_ALTER_COLUMN_ON_CLUSTER_DDL = (
+    "ALTER TABLE %(table_name)s ON CLUSTER %(cluster_name)s "
+    "MODIFY COLUMN %(column_name)s %(column_type)s"
+)
+
+
+def _jsonschema_to_sql_type(jsonschema_type: dict) -> sqlalchemy.types.TypeEngine:
+    """Convert a JSON Schema type to a Clickhouse-compatible SQLAlchemy type."""
+    sql_type = th.to_sql_type(jsonschema_type)
+
+    # Clickhouse does not support the DECIMAL type without providing precision,
+    # so we need to use the FLOAT type.
+    if sql_type.__class__ is sqlalchemy.types.DECIMAL:
+        sql_type = sqlalchemy.types.FLOAT()
+
+    return sql_type
+
+
+def _schema_key(jsonschema_type: dict) -> str:
+    """Return a canonical, hashable key for a JSON Schema type."""
+    return json.dumps(jsonschema_type, sort_keys=True)
+
+
+@lru_cache(maxsize=512)
+def _to_sql_type_cached(schema_key: str) -> sqlalchemy.types.TypeEngine:
+    """Convert a canonicalized JSON Schema type, memoizing the result."""
+    return _jsonschema_to_sql_type(json.loads(schema_key, use_decimal=True))
+
+
+@lru_cache(maxsize=256)
+def _parse_full_table_name_cached(
+    full_table_name: str,
+) -> tuple[str | None, str | None, str]:
+    """Parse a table name with the SDK implementation, memoizing the result."""
+    # The base implementation does not use the connector instance.
+    return SQLConnector.parse_full_table_name(
+        None, full_table_name,  # type: ignore[arg-type]
+    )
+
+
+def _month_partition_by(
+    columns: list[Column],
+    properties: dict,
+) -> ColumnElement | None:
+    """Return a monthly partition on the first date-time column, if there is one."""
+    for column in columns:
+        if properties[column.name].get("format") == "date-time":
+            return func.toYYYYMM(column)
+    return None
+
+
+_SINGER_SCHEMAS: tuple[dict[str, Any], ...] = (
+    {"type": "string"},
+    {"type": "string", "format": "date-time"},
+    {"type": "string", "format": "date"},
+    {"type": "integer"},
+    {"type": "number"},
+    {"type": "boolean"},
+    {"type": "array"},
+    {"type": "object"},
+)
+
+# Conversions for the common Singer types, in plain and nullable form, are built
+# at import time so most columns never go through th.to_sql_type.
+_TYPE_CACHE = {
+    _schema_key(jsonschema_type): _jsonschema_to_sql_type(jsonschema_type)
+    for jsonschema_type in (
+        *_SINGER_SCHEMAS,
+        *({**js, "type": [js["type"], "null"]} for js in _SINGER_SCHEMAS),
+    )
+}
+
 
 class ClickhouseConnector(SQLConnector):
     """Clickhouse Meltano Connector.
@@ -29,6 +121,9 @@ class ClickhouseConnector(SQLConnector):
     allow_merge_upsert: bool = False  # Whether MERGE UPSERT is supported.
     allow_temp_tables: bool = True  # Whether temp tables are supported.
 
+    # Table columns inspected by prepare_table, while its columns are adapted.
+    _inspected_columns: tuple[str, dict[str, Column]] | None = None
+
     def get_sqlalchemy_url(self, config: dict) -> str:
         """Generates a SQLAlchemy URL for clickhouse.
 
@@ -38,8 +133,85 @@ class ClickhouseConnector(SQLConnector):
         return super().get_sqlalchemy_url(config)
 
     def create_engine(self) -> Engine:
-        """Create a SQLAlchemy engine for clickhouse."""
-        return create_engine(self.get_sqlalchemy_url(self.config))
+        """Create a SQLAlchemy engine for clickhouse.
+
+        For the HTTP driver, all pooled connections share a single keep-alive
+        HTTP session. Pooled connections are only pinged on checkout for the
+        native driver, since HTTP connections hold no state to go stale.
+        """
+        url = self.get_sqlalchemy_url(self.config)
+        pool_size = self.config.get("pool_size", 10)
+        is_http = make_url(url).get_dialect().driver == "http"
+
+        connect_args = {}
+        if is_http:
+            connect_args["http_session"] = self._create_http_session(pool_size)
+
+        return create_engine(
+            url,
+            connect_args=connect_args,
+            pool_pre_ping=not is_http,
+            pool_size=pool_size,
+            max_overflow=20,
+            pool_recycle=3600,
+        )
+
+    @staticmethod
+    def _create_http_session(pool_size: int) -> requests.Session:
+        """Create a requests session with a sized HTTP connection pool.
+
+        Args:
+            pool_size: The maximum number of connections kept per host.
+        """
+        # The target only ever talks to one ClickHouse host, so a single host pool
+        # sized to the engine's pool is enough.
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, pool_block=False,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def native_insert_supported(self) -> bool:
+        """Whether rows can be inserted as native blocks, bypassing SQLAlchemy.
+
+        This is only possible with the native (TCP) driver.
+        """
+        return self._engine.dialect.driver == "native"
+
+    def bulk_insert_rows(
+        self,
+        full_table_name: str,
+        columns: list[str],
+        rows: Iterable[tuple],
+    ) -> int:
+        """Insert rows with the clickhouse-driver client, sent as native blocks.
+
+        Missing values (None) are written as the column default, matching how the
+        server treats NULL input for the non-Nullable columns this target creates.
+
+        Args:
+            full_table_name: the target table name.
+            columns: the column names, in the same order as each row's values.
+            rows: the rows to insert.
+
+        Returns:
+            The number of inserted rows.
+        """
+        quote = self._dialect.identifier_preparer.quote_identifier
+        column_list = ", ".join(quote(column) for column in columns)
+        raw_connection = self._engine.raw_connection()
+        try:
+            client = raw_connection.dbapi_connection.transport
+            return client.execute(
+                f"INSERT INTO {full_table_name} ({column_list}) VALUES",
+                rows,
+                settings={"input_format_null_as_default": True},
+            )
+        finally:
+            raw_connection.close()
 
     def to_sql_type(self, jsonschema_type: dict) -> sqlalchemy.types.TypeEngine:
         """Return a JSON Schema representation of the provided type.
@@ -53,16 +225,29 @@ class ClickhouseConnector(SQLConnector):
         Returns:
             The SQLAlchemy type representation of the data type.
         """
-        sql_type = th.to_sql_type(jsonschema_type)
+        # Singer schemas repeat the same column types, so conversions are cached.
+        try:
+            schema_key = _schema_key(jsonschema_type)
+        except TypeError:
+            return _jsonschema_to_sql_type(jsonschema_type)
+        return _TYPE_CACHE.get(schema_key) or _to_sql_type_cached(schema_key)
 
-        # Clickhouse does not support the DECIMAL type without providing precision,
-        # so we need to use the FLOAT type.
-        if type(sql_type) == sqlalchemy.types.DECIMAL:
-            sql_type = typing.cast(
-                sqlalchemy.types.TypeEngine, sqlalchemy.types.FLOAT(),
-            )
+    def parse_full_table_name(
+        self,
+        full_table_name: str,
+    ) -> tuple[str | None, str | None, str]:
+        """Parse a fully qualified table name into its parts.
+
+        Streams share a small set of table names, so parsed names are cached.
 
-        return sql_type
+        Args:
+            full_table_name: A table name or a fully qualified table name.
+
+        Returns:
+            A three part tuple (db_name, schema_name, table_name) with any unspecified
+            or unused parts returned as None.
+        """
+        return _parse_full_table_name_cached(full_table_name)
 
     def create_empty_table(
         self,
@@ -88,50 +273,182 @@ class ClickhouseConnector(SQLConnector):
             msg = "Temporary tables are not supported."
             raise NotImplementedError(msg)
 
-        _ = partition_keys  # Not supported in generic implementation.
-
+        cfg = self.config
         _, _, table_name = self.parse_full_table_name(full_table_name)
 
         # If config table name is set, then use it instead of the table name.
-        if self.config.get("table_name"):
-            table_name = self.config.get("table_name")
+        cfg_table_name = cfg.get("table_name")
+        if cfg_table_name:
+            table_name = cfg_table_name
 
         # Do not set schema, as it is not supported by Clickhouse.
-        meta = MetaData(schema=None, bind=self._engine)
-        columns: list[Column] = []
-        primary_keys = primary_keys or []
+        meta = MetaData(schema=None)
+        # Drop duplicate keys, keeping their order for the engine's ORDER BY.
+        primary_keys = list(dict.fromkeys(primary_keys or ()))
 
         # If config engine type is set, then use it instead of the default engine type.
-        if self.config.get("engine_type"):
-            engine_type = self.config.get("engine_type")
-        else:
-            engine_type = SupportedEngines.MERGE_TREE
-
-        try:
-            properties: dict = schema["properties"]
-        except KeyError as e:
+        engine_type = cfg.get("engine_type")
+        if not engine_type:
+            # Deduplicate rows by primary key at merge time when keys are declared.
+            if primary_keys and cfg.get("replace_mergetree_when_pk", True):
+                engine_type = SupportedEngines.REPLACING_MERGE_TREE
+            else:
+                engine_type = SupportedEngines.MERGE_TREE
+
+        properties: dict | None = schema.get("properties")
+        if not properties:
             msg = f"Schema for '{full_table_name}' does not define properties: {schema}"
-            raise RuntimeError(msg) from e
-        for property_name, property_jsonschema in properties.items():
-            is_primary_key = property_name in primary_keys
-            columns.append(
-                Column(
-                    property_name,
-                    self.to_sql_type(property_jsonschema),
-                    primary_key=is_primary_key,
-                ),
+            raise RuntimeError(msg)
+        pk_set = frozenset(primary_keys)
+        columns: list[Column] = [
+            Column(
+                property_name,
+                self.to_sql_type(property_jsonschema),
+                primary_key=property_name in pk_set,
             )
+            for property_name, property_jsonschema in properties.items()
+        ]
+
+        partition_by = None
+        if not partition_keys and cfg.get("auto_partition_by_month", False):
+            partition_by = _month_partition_by(columns, properties)
 
         table_engine = create_engine_wrapper(
-            engine_type=engine_type, primary_keys=primary_keys, config=self.config
+            engine_type=engine_type,
+            primary_keys=primary_keys,
+            config=cfg,
+            partition_by=partition_by,
         )
-        
+
         table_args = {}
+        cluster_name = cfg.get("cluster_name")
+        if cluster_name:
+            table_args["clickhouse_cluster"] = cluster_name
+
+        table = Table(table_name, meta, *columns, table_engine, **table_args)
+
+        # The caller has already checked that the table does not exist, so skip the
+        # preflight existence query and tolerate a concurrent create instead.
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(CreateTable(table))
+        except DatabaseException as e:
+            if _TABLE_ALREADY_EXISTS not in str(e):
+                raise
+            self.logger.info("Table '%s' already exists, skipping create.", table_name)
+
+    def prepare_table(
+        self,
+        full_table_name: str,
+        schema: dict,
+        primary_keys: list[str],
+        partition_keys: list[str] | None = None,
+        as_temp_table: bool = False,  # noqa: FBT002, FBT001
+    ) -> None:
+        """Adapt target table to provided schema if possible.
+
+        When `batch_ddl` is enabled, the table columns are inspected once, existing
+        columns are adapted against that inspection and all missing columns are
+        added with a single ALTER TABLE statement.
+
+        Args:
+            full_table_name: the target table name.
+            schema: the JSON Schema for the table.
+            primary_keys: list of key properties.
+            partition_keys: list of partition keys.
+            as_temp_table: True to create a temp table.
+        """
+        if not self.config.get("batch_ddl", True):
+            super().prepare_table(
+                full_table_name=full_table_name,
+                schema=schema,
+                primary_keys=primary_keys,
+                partition_keys=partition_keys,
+                as_temp_table=as_temp_table,
+            )
+            return
+
+        if not self.table_exists(full_table_name=full_table_name):
+            self.create_empty_table(
+                full_table_name=full_table_name,
+                schema=schema,
+                primary_keys=primary_keys,
+                partition_keys=partition_keys,
+                as_temp_table=as_temp_table,
+            )
+            return
+
+        existing_columns = self.get_table_columns(full_table_name)
+        new_columns: list[Column] = []
+        self._inspected_columns = (full_table_name, existing_columns)
+        try:
+            for property_name, property_def in schema["properties"].items():
+                sql_type = self.to_sql_type(property_def)
+                if property_name in existing_columns:
+                    self._adapt_column_type(
+                        full_table_name,
+                        column_name=property_name,
+                        sql_type=sql_type,
+                    )
+                else:
+                    new_columns.append(Column(property_name, sql_type))
+        finally:
+            self._inspected_columns = None
+
+        if new_columns:
+            self._create_empty_columns(full_table_name, new_columns)
+
+    def _get_column_type(
+        self,
+        full_table_name: str,
+        column_name: str,
+    ) -> sqlalchemy.types.TypeEngine:
+        """Get the SQL type of the declared column.
+
+        Uses the columns already inspected by `prepare_table` when available, so
+        that adapting many columns does not inspect the table for each one.
+
+        Args:
+            full_table_name: The name of the table.
+            column_name: The name of the column.
+
+        Returns:
+            The type of the column.
+        """
+        if self._inspected_columns is not None:
+            inspected_table_name, columns = self._inspected_columns
+            if inspected_table_name == full_table_name and column_name in columns:
+                return columns[column_name].type
+        return super()._get_column_type(full_table_name, column_name)
+
+    def _create_empty_columns(
+        self,
+        full_table_name: str,
+        columns: list[Column],
+    ) -> None:
+        """Create new columns with a single ALTER TABLE statement.
+
+        Args:
+            full_table_name: The target table name.
+            columns: The new columns to add.
+
+        Raises:
+            NotImplementedError: if adding columns is not supported.
+        """
+        if not self.allow_column_add:
+            msg = "Adding columns is not supported."
+            raise NotImplementedError(msg)
+
+        alter_table = f"ALTER TABLE {full_table_name}"
         if self.config.get("cluster_name"):
-            table_args["clickhouse_cluster"] = self.config.get("cluster_name")
+            alter_table += f" ON CLUSTER {self.config.get('cluster_name')}"
 
-        _ = Table(table_name, meta, *columns, table_engine, **table_args)
-        meta.create_all(self._engine)
+        with self._engine.begin() as conn:
+            add_columns = ", ".join(
+                f"ADD COLUMN {CreateColumn(column).compile(dialect=conn.dialect)}"
+                for column in columns
+            )
+            conn.exec_driver_sql(f"{alter_table} {add_columns}")
 
     def prepare_schema(self, _: str) -> None:
         """Create the target database schema.
@@ -143,6 +460,34 @@ class ClickhouseConnector(SQLConnector):
         """
         return
 
+    def get_column_add_ddl(  # type: ignore[override]
+        self,
+        table_name: str,
+        column_name: str,
+        column_type: sqlalchemy.types.TypeEngine,
+    ) -> sqlalchemy.DDL:
+        """Get the create column DDL statement.
+
+        Overrides the static method in the base class to support ON CLUSTER.
+
+        Args:
+            table_name: Fully qualified table name of column to alter.
+            column_name: Column name to create.
+            column_type: New column sqlalchemy type.
+
+        Returns:
+            A sqlalchemy DDL instance.
+        """
+        context = {
+            "table_name": table_name,
+            "create_column_clause": CreateColumn(Column(column_name, column_type)),
+        }
+        cluster_name = self.config.get("cluster_name")
+        if cluster_name:
+            context["cluster_name"] = cluster_name
+            return sqlalchemy.DDL(_ADD_COLUMN_ON_CLUSTER_DDL, context)
+        return sqlalchemy.DDL(_ADD_COLUMN_DDL, context)
+
     def get_column_alter_ddl(
         self,
         table_name: str,
@@ -161,21 +506,13 @@ class ClickhouseConnector(SQLConnector):
         Returns:
             A sqlalchemy DDL instance.
         """
-        if self.config.get("cluster_name"):
-            return sqlalchemy.DDL(
-                "ALTER TABLE %(table_name)s ON CLUSTER %(cluster_name)s MODIFY COLUMN %(column_name)s %(column_type)s",
-                {
-                    "table_name": table_name,
-                    "column_name": column_name,
-                    "column_type": column_type,
-                    "cluster_name": self.config.get("cluster_name"),
-                },
-            )
-        return sqlalchemy.DDL(
-            "ALTER TABLE %(table_name)s MODIFY COLUMN %(column_name)s %(column_type)s",
-            {
-                "table_name": table_name,
-                "column_name": column_name,
-                "column_type": column_type,
-            },
-        )
+        context = {
+            "table_name": table_name,
+            "column_name": column_name,
+            "column_type": column_type,
+        }
+        cluster_name = self.config.get("cluster_name")
+        if cluster_name:
+            context["cluster_name"] = cluster_name
+            return sqlalchemy.DDL(_ALTER_COLUMN_ON_CLUSTER_DDL, context)
+        return sqlalchemy.DDL(_ALTER_COLUMN_DDL, context)
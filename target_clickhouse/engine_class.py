@@ -1,5 +1,22 @@
-from clickhouse_sqlalchemy import engines
+from __future__ import annotations
+
 from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from clickhouse_sqlalchemy import engines
+
+if TYPE_CHECKING:
+    from sqlalchemy.sql import ColumnElement
+
+__all__ = [
+    "ENGINE_MAPPING",
+    "REPLICATED_ENGINES",
+    "SupportedEngines",
+    "create_engine_wrapper",
+    "get_engine_class",
+    "is_supported_engine",
+]
 
 
 class SupportedEngines(str, Enum):
@@ -13,44 +30,65 @@ class SupportedEngines(str, Enum):
     REPLICATED_AGGREGATING_MERGE_TREE = "ReplicatedAggregatingMergeTree"
 
 
+# Each supported engine maps to the clickhouse_sqlalchemy class of the same name.
 ENGINE_MAPPING = {
-    SupportedEngines.MERGE_TREE: engines.MergeTree,
-    SupportedEngines.REPLACING_MERGE_TREE: engines.ReplacingMergeTree,
-    SupportedEngines.SUMMING_MERGE_TREE: engines.SummingMergeTree,
-    SupportedEngines.AGGREGATING_MERGE_TREE: engines.AggregatingMergeTree,
-    SupportedEngines.REPLICATED_MERGE_TREE: engines.ReplicatedMergeTree,
-    SupportedEngines.REPLICATED_REPLACING_MERGE_TREE: engines.ReplicatedReplacingMergeTree,
-    SupportedEngines.REPLICATED_SUMMING_MERGE_TREE: engines.ReplicatedSummingMergeTree,
-    SupportedEngines.REPLICATED_AGGREGATING_MERGE_TREE: engines.ReplicatedAggregatingMergeTree,
+    engine_type: getattr(engines, engine_type.value)
+    for engine_type in SupportedEngines
+}
+assert len(ENGINE_MAPPING) == len(set(ENGINE_MAPPING.values()))  # noqa: S101
+
+REPLICATED_ENGINES = (
+    engines.ReplicatedMergeTree,
+    engines.ReplicatedReplacingMergeTree,
+    engines.ReplicatedSummingMergeTree,
+    engines.ReplicatedAggregatingMergeTree,
+)
+
+
+def _normalize_engine_type(engine_type: str) -> str:
+    return engine_type.lower().replace("_", "")
+
+
+# Allows e.g. "mergetree" or "merge_tree" to resolve to MergeTree.
+_NORMALIZED_MAPPING = {
+    _normalize_engine_type(engine_type.value): engine_class
+    for engine_type, engine_class in ENGINE_MAPPING.items()
 }
 
 
 def is_supported_engine(engine_type):
-    return engine_type in SupportedEngines.__members__.values()
+    return get_engine_class(engine_type) is not None
 
 
+# ENGINE_MAPPING is fixed after import, so lookups can be cached safely.
+@lru_cache(maxsize=None)
 def get_engine_class(engine_type):
-    return ENGINE_MAPPING.get(engine_type)
+    if not isinstance(engine_type, str):
+        return None
+    return ENGINE_MAPPING.get(engine_type) or _NORMALIZED_MAPPING.get(
+        _normalize_engine_type(engine_type),
+    )
+
 
+def create_engine_wrapper(
+    engine_type,
+    primary_keys,
+    config: dict | None = None,
+    partition_by: ColumnElement | None = None,
+):
+    engine_class = get_engine_class(engine_type)
 
-def create_engine_wrapper(engine_type, primary_keys, config: dict | None = None):
     # check if engine type is in supported engines
-    if is_supported_engine(engine_type) is False:
+    if engine_class is None:
         raise ValueError(f"Engine type {engine_type} is not supported.")
 
     engine_args = {"primary_key": primary_keys}
-    if config is not None:
-        if engine_type in (
-            SupportedEngines.REPLICATED_MERGE_TREE,
-            SupportedEngines.REPLICATED_REPLACING_MERGE_TREE,
-            SupportedEngines.REPLICATED_SUMMING_MERGE_TREE,
-            SupportedEngines.REPLICATED_AGGREGATING_MERGE_TREE,
-        ):
-            if config.get("table_path"):
-                engine_args["table_path"] = config.get("table_path")
-            if config.get("replica_name"):
-                engine_args["replica_name"] = config.get("replica_name")
-
-        engine_class = get_engine_class(engine_type)
+    if partition_by is not None:
+        engine_args["partition_by"] = partition_by
+    if config is not None and engine_class in REPLICATED_ENGINES:
+        if config.get("table_path"):
+            engine_args["table_path"] = config.get("table_path")
+        if config.get("replica_name"):
+            engine_args["replica_name"] = config.get("replica_name")
 
     return engine_class(**engine_args)
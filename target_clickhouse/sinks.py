@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import Any, Iterable, cast
 
 import simplejson as json
 from singer_sdk.sinks import SQLSink
@@ -54,9 +54,9 @@ class ClickhouseSink(SQLSink):
     ) -> int | None:
         """Bulk insert records to an existing destination table.
 
-        The default implementation uses a generic SQLAlchemy bulk insert operation.
-        This method may optionally be overridden by developers in order to provide
-        faster, native bulk uploads.
+        With the native driver, records are inserted through the clickhouse-driver
+        client as native blocks. Otherwise the generic SQLAlchemy bulk insert
+        operation is used.
 
         Args:
             full_table_name: the target table name.
@@ -72,4 +72,15 @@ class ClickhouseSink(SQLSink):
             for key, value in record.items():
                 if isinstance(value, dict):
                     record[key] = json.dumps(value)
-        return super().bulk_insert_records(full_table_name, schema, records)
+
+        connector = cast(ClickhouseConnector, self.connector)
+        if not connector.native_insert_supported:
+            return super().bulk_insert_records(full_table_name, schema, records)
+
+        # Send the batch as native blocks rather than a SQLAlchemy executemany.
+        property_names = list(self.conform_schema(schema)["properties"].keys())
+        rows = [
+            tuple(conformed_record.get(name) for name in property_names)
+            for conformed_record in map(self.conform_record, records)
+        ]
+        return connector.bulk_insert_rows(full_table_name, property_names, rows)
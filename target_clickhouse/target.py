@@ -25,6 +25,39 @@ class TargetClickhouse(SQLTarget):
             th.StringType,
             description="The name of the table to write to. Defaults to stream name.",
         ),
+        th.Property(
+            "pool_size",
+            th.IntegerType,
+            default=10,
+            description="The number of connections to keep open to ClickHouse.",
+        ),
+        th.Property(
+            "batch_ddl",
+            th.BooleanType,
+            default=True,
+            description=(
+                "Whether to add all new columns to an existing table with a single "
+                "ALTER TABLE statement."
+            ),
+        ),
+        th.Property(
+            "replace_mergetree_when_pk",
+            th.BooleanType,
+            default=True,
+            description=(
+                "Whether to default to the ReplacingMergeTree engine instead of "
+                "MergeTree for streams with primary keys, when engine_type is not set."
+            ),
+        ),
+        th.Property(
+            "auto_partition_by_month",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Whether to partition new tables by month on their first date-time "
+                "column."
+            ),
+        ),
     ).to_dict()
 
     default_sink_class = ClickhouseSink
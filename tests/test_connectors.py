@@ -0,0 +1,196 @@
+"""Tests the Clickhouse connector's DDL without a running server."""
+
+from __future__ import annotations
+
+import typing as t
+from unittest import mock
+
+import pytest
+import sqlalchemy
+from clickhouse_sqlalchemy.exceptions import DatabaseException
+from sqlalchemy import Column
+
+from target_clickhouse.connectors import ClickhouseConnector
+
+SQLALCHEMY_URL = "clickhouse+http://default:@localhost:18123"
+
+
+def make_connector(**config: t.Any) -> ClickhouseConnector:
+    return ClickhouseConnector(config={"sqlalchemy_url": SQLALCHEMY_URL, **config})
+
+
+@pytest.fixture()
+def engine() -> t.Iterator[mock.MagicMock]:
+    """Replace the connector engine with a mock that records executed DDL."""
+    dialect = sqlalchemy.create_engine(SQLALCHEMY_URL).dialect
+    engine = mock.MagicMock(dialect=dialect)
+    engine.begin.return_value.__enter__.return_value.dialect = dialect
+    with mock.patch.object(
+        ClickhouseConnector,
+        "_engine",
+        new_callable=mock.PropertyMock,
+        return_value=engine,
+    ):
+        yield engine
+
+
+def executed_sql(engine: mock.MagicMock) -> list[str]:
+    conn = engine.begin.return_value.__enter__.return_value
+    return [call.args[0] for call in conn.exec_driver_sql.call_args_list]
+
+
+def created_table_sql(engine: mock.MagicMock) -> str:
+    conn = engine.begin.return_value.__enter__.return_value
+    (create_table,) = conn.execute.call_args.args
+    return str(create_table.compile(dialect=engine.dialect)).strip()
+
+
+SCHEMA = {
+    "properties": {
+        "id": {"type": "integer"},
+        "updated_at": {"type": "string", "format": "date-time"},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    ("config", "primary_keys", "expected"),
+    [
+        ({}, ["id"], "ReplacingMergeTree"),
+        ({}, [], "MergeTree"),
+        ({"replace_mergetree_when_pk": False}, ["id"], "MergeTree"),
+        ({"engine_type": "MergeTree"}, ["id"], "MergeTree"),
+        ({"engine_type": "summing_merge_tree"}, ["id"], "SummingMergeTree"),
+    ],
+)
+def test_create_empty_table_engine(engine, config, primary_keys, expected):
+    make_connector(**config).create_empty_table("tbl", SCHEMA, primary_keys)
+    assert f"ENGINE = {expected}()" in created_table_sql(engine)
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        ({}, "ALTER TABLE tbl ADD COLUMN a VARCHAR, ADD COLUMN b INTEGER"),
+        (
+            {"cluster_name": "c1"},
+            "ALTER TABLE tbl ON CLUSTER c1 ADD COLUMN a VARCHAR, ADD COLUMN b INTEGER",
+        ),
+    ],
+)
+def test_create_empty_columns(engine, config, expected):
+    connector = make_connector(**config)
+    connector._create_empty_columns(  # noqa: SLF001
+        "tbl",
+        [
+            Column("a", sqlalchemy.types.VARCHAR()),
+            Column("b", sqlalchemy.types.INTEGER()),
+        ],
+    )
+    assert executed_sql(engine) == [expected]
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        ({}, "ALTER TABLE tbl ADD COLUMN a VARCHAR"),
+        ({"cluster_name": "c1"}, "ALTER TABLE tbl ON CLUSTER c1 ADD COLUMN a VARCHAR"),
+    ],
+)
+def test_get_column_add_ddl(engine, config, expected):
+    ddl = make_connector(**config).get_column_add_ddl(
+        "tbl",
+        "a",
+        sqlalchemy.types.VARCHAR(),
+    )
+    assert str(ddl.compile(dialect=engine.dialect)) == expected
+
+
+def test_prepare_table_inspects_once(engine):
+    connector = make_connector()
+    existing_columns = {
+        "id": Column("id", sqlalchemy.types.INTEGER()),
+        "name": Column("name", sqlalchemy.types.VARCHAR()),
+        "score": Column("score", sqlalchemy.types.INTEGER()),
+    }
+    schema = {
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": "string"},
+            "score": {"type": "string"},
+            "email": {"type": "string"},
+            "age": {"type": "integer"},
+        },
+    }
+    with mock.patch.object(
+        ClickhouseConnector,
+        "table_exists",
+        return_value=True,
+    ), mock.patch.object(
+        ClickhouseConnector,
+        "get_table_columns",
+        return_value=existing_columns,
+    ) as get_table_columns:
+        connector.prepare_table("tbl", schema, primary_keys=["id"])
+
+    get_table_columns.assert_called_once_with("tbl")
+    assert executed_sql(engine) == [
+        "ALTER TABLE tbl ADD COLUMN email VARCHAR, ADD COLUMN age INTEGER",
+    ]
+    conn = engine.connect.return_value.execution_options.return_value
+    (alter_column,) = conn.__enter__.return_value.execute.call_args.args
+    assert str(alter_column.compile(dialect=engine.dialect)) == (
+        "ALTER TABLE tbl MODIFY COLUMN score VARCHAR"
+    )
+
+
+def test_create_empty_table_already_exists(engine):
+    conn = engine.begin.return_value.__enter__.return_value
+    conn.execute.side_effect = DatabaseException(
+        Exception("Code: 57. DB::Exception: Table default.tbl already exists."),
+    )
+    make_connector().create_empty_table(
+        "tbl",
+        {"properties": {"id": {"type": "integer"}}},
+    )
+
+
+def test_create_empty_table_other_error(engine):
+    conn = engine.begin.return_value.__enter__.return_value
+    conn.execute.side_effect = DatabaseException(
+        Exception("Code: 571. DB::Exception: Database replication failed."),
+    )
+    with pytest.raises(DatabaseException, match="Code: 571"):
+        make_connector(cluster_name="c1").create_empty_table(
+            "tbl",
+            {"properties": {"id": {"type": "integer"}}},
+        )
+
+
+def test_create_empty_table_partition_by_month(engine):
+    connector = make_connector(auto_partition_by_month=True)
+    connector.create_empty_table("tbl", SCHEMA, primary_keys=["id"])
+    assert created_table_sql(engine) == (
+        "CREATE TABLE tbl (\n"
+        "\tid INTEGER, \n"
+        "\tupdated_at DATETIME\n"
+        ") ENGINE = ReplacingMergeTree()\n"
+        " PARTITION BY toYYYYMM(updated_at)\n"
+        " ORDER BY id\n"
+        " PRIMARY KEY id"
+    )
+
+
+@pytest.mark.parametrize(
+    ("config", "schema"),
+    [
+        ({}, SCHEMA),
+        (
+            {"auto_partition_by_month": True},
+            {"properties": {"id": {"type": "integer"}}},
+        ),
+    ],
+)
+def test_create_empty_table_no_partition(engine, config, schema):
+    make_connector(**config).create_empty_table("tbl", schema, primary_keys=["id"])
+    assert "PARTITION BY" not in created_table_sql(engine)
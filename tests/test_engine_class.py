@@ -0,0 +1,36 @@
+"""Tests engine type resolution."""
+
+from __future__ import annotations
+
+import pytest
+from clickhouse_sqlalchemy import engines
+
+from target_clickhouse.engine_class import (
+    SupportedEngines,
+    create_engine_wrapper,
+    get_engine_class,
+    is_supported_engine,
+)
+
+
+@pytest.mark.parametrize(
+    ("engine_type", "expected"),
+    [
+        ("MergeTree", engines.MergeTree),
+        (SupportedEngines.MERGE_TREE, engines.MergeTree),
+        ("mergetree", engines.MergeTree),
+        ("merge_tree", engines.MergeTree),
+        ("REPLICATED_REPLACING_MERGE_TREE", engines.ReplicatedReplacingMergeTree),
+    ],
+)
+def test_get_engine_class(engine_type, expected):
+    assert get_engine_class(engine_type) is expected
+    assert is_supported_engine(engine_type)
+
+
+@pytest.mark.parametrize("engine_type", ["Memory", "", None])
+def test_get_engine_class_unsupported(engine_type):
+    assert get_engine_class(engine_type) is None
+    assert not is_supported_engine(engine_type)
+    with pytest.raises(ValueError, match="is not supported"):
+        create_engine_wrapper(engine_type=engine_type, primary_keys=["id"])
@@ -0,0 +1,45 @@
+"""Tests the Clickhouse sink's native insert path without a running server."""
+
+from __future__ import annotations
+
+import typing as t
+from unittest import mock
+
+import sqlalchemy
+
+from target_clickhouse.connectors import ClickhouseConnector
+from target_clickhouse.sinks import ClickhouseSink
+from target_clickhouse.target import TargetClickhouse
+
+SQLALCHEMY_URL = "clickhouse+native://default:@localhost:19000/default"
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+    },
+}
+
+
+def test_native_insert_with_missing_field():
+    target = TargetClickhouse(config={"sqlalchemy_url": SQLALCHEMY_URL})
+    engine = mock.MagicMock(dialect=sqlalchemy.create_engine(SQLALCHEMY_URL).dialect)
+    client = engine.raw_connection.return_value.dbapi_connection.transport
+    client.execute.return_value = 2
+
+    with mock.patch.object(ClickhouseSink, "setup"), mock.patch.object(
+        ClickhouseConnector,
+        "_engine",
+        new_callable=mock.PropertyMock,
+        return_value=engine,
+    ):
+        sink = ClickhouseSink(target, "stream", SCHEMA, ["id"])
+        records: list[dict[str, t.Any]] = [{"id": 1, "name": "a"}, {"id": 2}]
+        assert sink.bulk_insert_records("tbl", SCHEMA, records) == len(records)
+
+    client.execute.assert_called_once_with(
+        'INSERT INTO tbl ("id", "name") VALUES',
+        [(1, "a"), (2, None)],
+        settings={"input_format_null_as_default": True},
+    )